@@ -1,22 +1,37 @@
 """Unified configuration loading for Job Hunter."""
 
-import json
+import copy
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+from .json_utils import load_json
+
 DEFAULT_CONFIG_PATH = "~/.config/job-hunter/config.json"
 
 
+@lru_cache(maxsize=8)
+def _load_config_file(path: str, mtime_ns: int) -> dict:
+    """Parse a config file; mtime_ns keys the cache so edits are picked up."""
+    return load_json(path)
+
+
 def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> dict:
-    """Load configuration from JSON file."""
-    path = Path(config_path).expanduser()
-    if not path.exists():
+    """Load configuration from JSON file.
+
+    Parsed configs are cached per resolved path for the life of the process,
+    so a caller running several scrapers in sequence reads the file once.
+    Each call returns its own copy, safe to mutate.
+    """
+    path = Path(config_path).expanduser().resolve()
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         print(f"Error: Config file not found at {path}", file=sys.stderr)
         print("Run setup_config.py to create configuration.", file=sys.stderr)
         sys.exit(1)
 
-    with open(path) as f:
-        return json.load(f)
+    return copy.deepcopy(_load_config_file(str(path), mtime_ns))
 
 
 def get_user_info(config: dict) -> dict:
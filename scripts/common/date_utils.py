@@ -2,31 +2,51 @@
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 
+_REL_RE = re.compile(r"(\d+)\s+(minute|hour|day|week|month)s?\s+ago", re.IGNORECASE)
 
-def parse_job_date(date_str: str) -> datetime | None:
+
+@lru_cache(maxsize=4096)
+def _parse_absolute(date_str: str) -> datetime | None:
+    """Parse an absolute (ISO or named-month) date string; cached since many jobs share one."""
+    # ISO 8601 (the common case) — fromisoformat is far cheaper than strptime
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        pass
+
+    # Named-month formats: "January 27, 2025" / "Jan 27, 2025"
+    for fmt in ("%B %d, %Y", "%b %d, %Y"):
+        try:
+            return datetime.strptime(date_str, fmt).replace(tzinfo=None)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_job_date(date_str: str, now: datetime | None = None) -> datetime | None:
     """Parse a job posting date string into a datetime.
 
     Supports:
     - ISO 8601: "2025-01-27T10:00:00Z"
     - Date only: "2025-01-27"
     - Relative: "2 hours ago", "1 day ago", "3 days ago"
+
+    Relative dates are anchored at `now` (default: the current time), so a
+    batch of jobs can share a single clock reading.
     """
     if not date_str:
         return None
 
     date_str = date_str.strip()
 
-    # ISO 8601
-    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y"):
-        try:
-            return datetime.strptime(date_str, fmt).replace(tzinfo=None)
-        except ValueError:
-            continue
+    parsed = _parse_absolute(date_str)
+    if parsed is not None:
+        return parsed
 
     # Relative time: "X hours/days/minutes ago"
-    match = re.match(r"(\d+)\s+(minute|hour|day|week|month)s?\s+ago", date_str, re.IGNORECASE)
+    match = _REL_RE.match(date_str)
     if match:
         amount = int(match.group(1))
         unit = match.group(2).lower()
@@ -37,14 +57,15 @@ def parse_job_date(date_str: str) -> datetime | None:
             "week": timedelta(weeks=amount),
             "month": timedelta(days=amount * 30),
         }
-        return datetime.now() - deltas.get(unit, timedelta())
+        return (now or datetime.now()) - deltas.get(unit, timedelta())
 
     return None
 
 
 def is_within_hours(date_str: str, hours: int = 24) -> bool:
     """Check if a date string is within the last N hours."""
-    parsed = parse_job_date(date_str)
+    now = datetime.now()
+    parsed = parse_job_date(date_str, now)
     if parsed is None:
         return True  # Include if we can't parse (benefit of the doubt)
-    return (datetime.now() - parsed) <= timedelta(hours=hours)
+    return (now - parsed) <= timedelta(hours=hours)
@@ -4,19 +4,28 @@ import hashlib
 import re
 from pathlib import Path
 
+_NORM_RE = re.compile(r"[^a-z0-9 ]")
+# Tracker table link cell: [Apply](url). A URL never spans a cell or line.
+_APPLY_URL_RE = re.compile(rb"\[(?:Apply|Link)\]\(([^)|\n]+)\)")
+
+
+def _hash12(s: str) -> str:
+    """12-hex-char digest used for job IDs (blake2b is cheaper than md5 on short strings)."""
+    return hashlib.blake2b(s.encode(), digest_size=6).hexdigest()
+
 
 def generate_job_id(job: dict) -> str:
     """Generate a unique ID for a job based on URL (primary) or title+company+location."""
     url = job.get("url", "").strip()
     if url:
-        return hashlib.md5(url.encode()).hexdigest()[:12]
+        return _hash12(url)
     key = f"{job.get('title', '')}-{job.get('company', '')}-{job.get('location', '')}"
-    return hashlib.md5(key.encode()).hexdigest()[:12]
+    return _hash12(key)
 
 
 def _normalize_title(title: str) -> str:
     """Lowercase, strip punctuation for fuzzy title matching."""
-    return re.sub(r"[^a-z0-9 ]", "", title.lower()).strip()
+    return _NORM_RE.sub("", title.lower()).strip()
 
 
 def deduplicate_jobs(jobs: list[dict]) -> list[dict]:
@@ -32,22 +41,18 @@ def deduplicate_jobs(jobs: list[dict]) -> list[dict]:
     SOURCE_RANK = {"linkedin": 0, "indeed": 1, "glassdoor": 2,
                    "zip_recruiter": 3, "google": 4, "builtin": 5, "wellfound": 6}
 
-    # Pass 1: URL dedup (empty URLs are not treated as duplicates of each other)
-    seen_urls: set[str] = set()
-    url_unique: list[dict] = []
+    # Pass 1: URL dedup (empty URLs are not treated as duplicates of each other).
+    # One ordered dict serves as both the seen-set and the unique list; URL-less
+    # jobs are keyed by object identity so each one is kept in place.
+    url_unique: dict[str | int, dict] = {}
     for job in jobs:
         url = job.get("url", "").strip()
-        if not url:
-            url_unique.append(job)
-            continue
-        if url not in seen_urls:
-            seen_urls.add(url)
-            url_unique.append(job)
+        url_unique.setdefault(url or id(job), job)
 
     # Pass 2: (title, company) dedup — keep best-source version
     title_map: dict[tuple[str, str], dict] = {}
     keyless: list[dict] = []
-    for job in url_unique:
+    for job in url_unique.values():
         title_key = _normalize_title(job.get("title", ""))
         company_key = _normalize_title(job.get("company", ""))
         if not title_key:
@@ -71,28 +76,56 @@ def load_seen_jobs(obsidian_path: str) -> set[str]:
     if not vault.exists():
         return set()
 
-    tracker_files = list(vault.glob("Job Tracker*.md"))
-    if not tracker_files:
-        return set()
-
     seen = set()
-    for tracker_path in tracker_files:
-        with open(tracker_path) as f:
-            content = f.read()
-            for line in content.split("\n"):
-                if "|" not in line or line.startswith("|--"):
-                    continue
-                parts = [p.strip() for p in line.split("|")]
-                for part in parts:
-                    # New format: extract URL from [Apply](url) and hash it
-                    for url in re.findall(r'\[(?:Apply|Link)\]\(([^)]+)\)', part):
-                        seen.add(hashlib.md5(url.encode()).hexdigest()[:12])
+    for tracker_path in vault.glob("Job Tracker*.md"):
+        # One scan over the raw bytes instead of splitting lines and cells
+        data = tracker_path.read_bytes()
+        for m in _APPLY_URL_RE.finditer(data):
+            seen.add(_hash12(m.group(1).decode(errors="replace").strip()))
     return seen
 
 
-def filter_seen_jobs(jobs: list[dict], obsidian_path: str) -> list[dict]:
-    """Filter out jobs that have already been seen."""
-    seen_ids = load_seen_jobs(obsidian_path)
+def prefilter(raw: list[dict], url_of, stub_of, normalize,
+              seen_urls: set[str], seen_ids: set[str],
+              id_cache: dict[str, str] | None = None) -> tuple[list[dict], int]:
+    """Normalize a scraper's raw results, skipping work that can't survive.
+
+    Results whose URL an earlier batch already produced (tracked in
+    `seen_urls`, updated in place) are dropped. Results whose URL id is in
+    `seen_ids` are not normalized: `stub_of(raw)` (title, company, source)
+    stands in for them so deduplicate_jobs still suppresses their
+    (title, company) copies, and filter_seen_jobs removes the stub later.
+    Blank URLs are never repeats. `id_cache`, if given, receives url -> id.
+
+    Returns (jobs, number of tracked stubs among them).
+    """
+    batch = []
+    tracked = 0
+    for r in raw:
+        url = url_of(r).strip()
+        if url:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            job_id = _hash12(url)
+            if id_cache is not None:
+                id_cache[url] = job_id
+            if job_id in seen_ids:
+                batch.append({**stub_of(r), "url": url, "id": job_id})
+                tracked += 1
+                continue
+        batch.append(normalize(r))
+    return batch, tracked
+
+
+def filter_seen_jobs(jobs: list[dict], obsidian_path: str,
+                     seen_ids: set[str] | None = None) -> list[dict]:
+    """Filter out jobs that have already been seen.
+
+    Pass `seen_ids` (from load_seen_jobs) to reuse an already-loaded set.
+    """
+    if seen_ids is None:
+        seen_ids = load_seen_jobs(obsidian_path)
     original_count = len(jobs)
     filtered = [j for j in jobs if j.get("id") not in seen_ids]
     print(f"Filtered {original_count - len(filtered)} previously seen jobs")
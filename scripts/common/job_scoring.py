@@ -1,8 +1,17 @@
 """Job scoring logic - scores jobs against resume content."""
 
+import os
+import re
 import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+from .dedup import _hash12
+
+# Extracted .docx/.pdf resume text, keyed on resume path + mtime
+RESUME_CACHE_DIR = Path.home() / ".cache" / "job-hunter"
+
 # Fallback skill list if resume cannot be read
 _FALLBACK_SKILLS = [
     'python', 'sql', 'tableau', 'data analyst', 'data science', 'data scientist',
@@ -31,6 +40,25 @@ _BONUS_RULES = [
     (['remote', 'hybrid'],                                       5),
 ]
 
+# Inverted index: bonus keyword -> indices of the rules it triggers.
+# Lets a job's bonus be summed straight from its set of matched terms.
+_BONUS_KEYWORD_RULES: dict[str, list[int]] = {}
+for _i, (_keywords, _) in enumerate(_BONUS_RULES):
+    for _kw in _keywords:
+        _BONUS_KEYWORD_RULES.setdefault(_kw, []).append(_i)
+
+
+def _overlapping_alternation(terms) -> re.Pattern:
+    """Compile terms into one regex whose findall() reports, at every offset,
+    the longest term starting there.
+
+    A shorter term found in the text is always a substring of some reported
+    match, so callers expand matches through a substring closure to recover
+    exactly the `term in text` results of a per-term scan.
+    """
+    alternatives = sorted(terms, key=len, reverse=True)
+    return re.compile('(?=(' + '|'.join(re.escape(t) for t in alternatives) + '))')
+
 
 def load_resume_text(resume_path: str) -> str:
     """Load plain text from a resume file (.docx or .txt/.pdf)."""
@@ -40,25 +68,64 @@ def load_resume_text(resume_path: str) -> str:
         return ""
 
     suffix = path.suffix.lower()
+    if suffix not in ('.docx', '.pdf'):
+        try:
+            return path.read_text(errors='ignore')
+        except Exception as e:
+            print(f"[scoring] Could not read resume: {e}", file=sys.stderr)
+            return ""
+
+    # Parsing .docx/.pdf is slow; reuse the text from an earlier run as long
+    # as the resume file hasn't been modified since.
+    path_key = _hash12(str(path.resolve()))
+    try:
+        cache_path = RESUME_CACHE_DIR / f"resume-{path_key}.{path.stat().st_mtime_ns}.txt"
+    except OSError:
+        cache_path = None  # can't key the cache; parse without it
+    if cache_path is not None:
+        try:
+            return cache_path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            pass  # not cached yet
+
     try:
         if suffix == '.docx':
             from docx import Document  # python-docx
             doc = Document(str(path))
-            return ' '.join(p.text for p in doc.paragraphs)
-        elif suffix == '.pdf':
+            text = ' '.join(p.text for p in doc.paragraphs)
+        else:
             import PyPDF2
-            text = []
+            pages = []
             with open(path, 'rb') as f:
                 reader = PyPDF2.PdfReader(f)
                 for page in reader.pages:
-                    text.append(page.extract_text() or '')
-            return ' '.join(text)
-        else:
-            return path.read_text(errors='ignore')
+                    pages.append(page.extract_text() or '')
+            text = ' '.join(pages)
     except Exception as e:
         print(f"[scoring] Could not read resume: {e}", file=sys.stderr)
         return ""
 
+    if cache_path is None:
+        return text
+    try:
+        RESUME_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in RESUME_CACHE_DIR.glob(f"resume-{path_key}.*.txt"):
+            stale.unlink()
+        # Write a temp file and rename it into place, so an interrupted run
+        # never leaves a truncated cache entry behind. mkstemp creates it 0600
+        # (resume contents; owner only).
+        fd, tmp = tempfile.mkstemp(dir=RESUME_CACHE_DIR, prefix=".resume-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, ValueError) as e:  # ValueError: UnicodeEncodeError
+        print(f"[scoring] Could not cache resume text: {e}", file=sys.stderr)
+    return text
+
 
 def extract_skills_from_resume(resume_text: str) -> list[str]:
     """Extract matchable skill keywords from resume text.
@@ -110,27 +177,60 @@ def extract_skills_from_resume(resume_text: str) -> list[str]:
     return result
 
 
-def score_job(job: dict, resume_skills: list[str]) -> tuple[int, str]:
-    """Score a single job against resume skills. Returns (score, match_reason)."""
+@lru_cache(maxsize=8)
+def _build_matcher(resume_skills: tuple[str, ...]):
+    """Build a function mapping lowercased job text to the set of terms in it.
+
+    Covers every skill and bonus keyword, so score_job finds all of them in a
+    single pass instead of one substring scan per keyword. Uses an
+    Aho-Corasick automaton when pyahocorasick is installed, else one compiled
+    regex alternation expanded through a substring closure. Cached per skill
+    tuple, so repeated scoring in one process compiles it only once.
+    """
+    terms = set(resume_skills) | set(_BONUS_KEYWORD_RULES)
+
+    try:
+        import ahocorasick
+    except ImportError:
+        pattern = _overlapping_alternation(terms)
+        closure = {t: {sub for sub in terms if sub in t} for t in terms}
+
+        def match_terms(text: str) -> set[str]:
+            hits = set()
+            for t in set(pattern.findall(text)):
+                hits |= closure[t]
+            return hits
+
+        return match_terms
+
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return lambda text: {term for _, term in automaton.iter(text)}
+
+
+def score_job(job: dict, resume_skills: list[str], matcher=None) -> tuple[int, str]:
+    """Score a single job against resume skills. Returns (score, match_reason).
+
+    `matcher` comes from _build_matcher(resume_skills); score_jobs looks it
+    up once per batch. It is fetched from the cache when omitted.
+    """
+    if matcher is None:
+        matcher = _build_matcher(tuple(resume_skills))
+
     text = (
         job.get('title', '') + ' ' +
         job.get('description', '') + ' ' +
         job.get('company', '')
     ).lower()
 
-    score = 0
-    matches = []
-
-    # Per-skill keyword match: +5 each
-    for skill in resume_skills:
-        if skill in text:
-            score += 5
-            matches.append(skill)
-
-    # Bonus rules
-    for keywords, points in _BONUS_RULES:
-        if any(kw in text for kw in keywords):
-            score += points
+    # One pass yields the job's set of matched terms; score it as a sparse
+    # row against the per-skill (+5) and per-rule weights.
+    hits = matcher(text)
+    matches = [skill for skill in resume_skills if skill in hits]
+    rules_hit = {i for term in hits for i in _BONUS_KEYWORD_RULES.get(term, ())}
+    score = 5 * len(matches) + sum(_BONUS_RULES[i][1] for i in rules_hit)
 
     score = min(score, 100)
     reason = f"Matches: {', '.join(matches[:6])}" if matches else 'General fit'
@@ -157,8 +257,9 @@ def score_jobs(
         else:
             resume_skills = _FALLBACK_SKILLS
 
+    matcher = _build_matcher(tuple(resume_skills))
     for job in jobs:
-        s, reason = score_job(job, resume_skills)
+        s, reason = score_job(job, resume_skills, matcher)
         job['match_score'] = s
         job['match_reason'] = reason
 
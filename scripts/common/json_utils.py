@@ -0,0 +1,67 @@
+"""JSON file helpers; use orjson when installed, else the stdlib."""
+
+import json
+import sys
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+loads = orjson.loads if orjson else json.loads
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def load_json(path: str | Path):
+    """Read and parse a JSON file (path may start with ~)."""
+    with open(Path(path).expanduser(), "rb") as f:
+        return loads(f.read())
+
+
+def _write_orjson(obj, f) -> None:
+    """Write obj to binary file f. Lists are streamed one element at a time,
+    so peak memory is one serialized record rather than the whole document;
+    layout matches a single indent=2 dump."""
+    option = orjson.OPT_INDENT_2
+    if not isinstance(obj, list):
+        f.write(orjson.dumps(obj, option=option, default=str))
+        return
+    if not obj:
+        f.write(b"[]")
+        return
+    f.write(b"[\n")
+    for i, item in enumerate(obj):
+        if i:
+            f.write(b",\n")
+        # Re-indent one level; JSON strings never contain a raw newline
+        f.write(b"  " + orjson.dumps(item, option=option, default=str).replace(b"\n", b"\n  "))
+    f.write(b"\n]")
+
+
+def dump_json(obj, path: str | Path | None = None) -> None:
+    """Write obj as indented JSON to path, or to stdout when path is None.
+
+    Values JSON can't represent natively are written via str().
+    """
+    if orjson:
+        if path is None:
+            sys.stdout.flush()
+            _write_orjson(obj, sys.stdout.buffer)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
+        else:
+            with open(Path(path).expanduser(), "wb") as f:
+                _write_orjson(obj, f)
+    elif path is None:
+        json.dump(obj, sys.stdout, indent=2, default=str)
+        print()
+    else:
+        with open(Path(path).expanduser(), "w") as f:
+            json.dump(obj, f, indent=2, default=str)
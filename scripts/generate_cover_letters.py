@@ -8,25 +8,40 @@ Usage:
 """
 
 import argparse
-import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from common.config import load_config, get_user_info
+from common.json_utils import load_json
+
+# Letters are independent files, so larger batches are rendered and written
+# concurrently; a handful is faster written serially than via a thread pool
+MAX_WRITE_WORKERS = 8
+MIN_PARALLEL_LETTERS = 8
+
+_MD_HEADER = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_DOTS_LINE = re.compile(r'^\s*[.\-*]+\s*$', re.MULTILINE)
+_BLANK_RUN = re.compile(r'\n{3,}')
+# Lines that look like requirements: start with a verb or "X years"
+_REQ_PREFIX = re.compile(
+    r'^(experience|profici|strong|knowledge|ability|bachelor|master|phd|\d+\+?\s+year)',
+    re.IGNORECASE,
+)
 
 
 def clean_description(text: str) -> str:
     """Strip markdown headers, deduplicate lines, and remove sidebar noise."""
     # Remove markdown headers (# ## ###)
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    text = _MD_HEADER.sub('', text)
     # Remove lines that are just dots or dashes
-    text = re.sub(r'^\s*[.\-*]+\s*$', '', text, flags=re.MULTILINE)
+    text = _DOTS_LINE.sub('', text)
     # Collapse runs of blank lines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _BLANK_RUN.sub('\n\n', text)
     # Remove duplicate consecutive sentences/lines (LinkedIn sidebar)
     seen, deduped = set(), []
     for line in text.split('\n'):
@@ -44,41 +59,21 @@ def extract_key_requirements(description: str) -> list[str]:
     reqs = []
     for line in description.split('\n'):
         line = line.strip().lstrip('*•-').strip()
-        # Lines that look like requirements: start with a verb or "X years"
-        if (len(line) > 20 and len(line) < 200
-                and re.match(r'^(experience|profici|strong|knowledge|ability|bachelor|master|phd|\d+\+?\s+year)', line.lower())):
+        if 20 < len(line) < 200 and _REQ_PREFIX.match(line):
             reqs.append(line)
         if len(reqs) >= 5:
             break
     return reqs
 
 
-def generate_cover_letter(job: dict, config: dict) -> str:
-    """Generate a cover letter for a job posting."""
-    title = job.get('title', 'Position')
-    company = job.get('company', 'Company')
-    location = job.get('location', 'N/A')
-    match_score = job.get('match_score', 0)
-    raw_description = job.get('description', '')
-    description = clean_description(raw_description)
-
-    user_info = get_user_info(config)
-    user_name = user_info["name"] or "Your Name"
-
-    # Build a short description snippet (first 2 clean sentences, no markdown)
-    first_para = description.split('\n\n')[0].replace('\n', ' ').strip()
-    # Trim to first 250 chars at a sentence boundary
-    if len(first_para) > 250:
-        cut = first_para[:250].rfind('. ')
-        first_para = first_para[:cut + 1] if cut > 50 else first_para[:250]
-
-    cover_letter = f"""# Cover Letter - {company}
+# Cover letter body, filled by generate_cover_letter via str.format_map
+_TEMPLATE = """# Cover Letter - {company}
 
 **Position:** {title}
 **Company:** {company}
 **Location:** {location}
 **Match Score:** {match_score}/100
-**Date Created:** {datetime.now().strftime('%Y-%m-%d')}
+**Date Created:** {today}
 
 ---
 
@@ -109,28 +104,115 @@ Sincerely,
 
 ## Job Details
 
-**Posted:** {job.get('posted_date') or 'Unknown'}
-**Remote:** {'Yes' if job.get('remote') else 'No'}
-**Employment Type:** {job.get('employment_type') or 'Not specified'}
-**Salary:** {job.get('salary') or 'Not specified'}
+**Posted:** {posted_date}
+**Remote:** {remote}
+**Employment Type:** {employment_type}
+**Salary:** {salary}
 
-**Application URL:** {job.get('url', '#')}
+**Application URL:** {url}
 
 ### Match Reason:
-{job.get('match_reason', 'General fit')}
+{match_reason}
 
 ### Description Excerpt:
-{description[:600] if description else 'No description available'}
+{excerpt}
 
 ---
 
-**Tags:** #cover-letter #job-application #{company.replace(' ', '-').replace(',', '').lower()}
+**Tags:** #cover-letter #job-application #{company_tag}
 **Status:** Draft
 **Applied:** [ ] No
 
 """
 
-    return cover_letter
+# Characters that can't appear in a cover-letter filename
+_FILENAME_UNSAFE = str.maketrans({'/': '_', ':': '_', '|': '_'})
+
+
+def generate_cover_letter(job: dict, config: dict, today: str | None = None,
+                          user_info: dict | None = None) -> str:
+    """Generate a cover letter for a job posting.
+
+    `today` (YYYY-MM-DD) and `user_info` are batch constants; callers writing
+    many letters pass them in so they are computed once per run.
+    """
+    title = job.get('title', 'Position')
+    company = job.get('company', 'Company')
+    location = job.get('location', 'N/A')
+    match_score = job.get('match_score', 0)
+    raw_description = job.get('description', '')
+    description = clean_description(raw_description)
+
+    user_info = user_info or get_user_info(config)
+    today = today or datetime.now().strftime('%Y-%m-%d')
+    user_name = user_info["name"] or "Your Name"
+
+    # Build a short description snippet (first 2 clean sentences, no markdown)
+    first_para = description.split('\n\n')[0].replace('\n', ' ').strip()
+    # Trim to first 250 chars at a sentence boundary
+    if len(first_para) > 250:
+        cut = first_para[:250].rfind('. ')
+        first_para = first_para[:cut + 1] if cut > 50 else first_para[:250]
+
+    return _TEMPLATE.format_map({
+        'title': title,
+        'company': company,
+        'location': location,
+        'match_score': match_score,
+        'today': today,
+        'user_name': user_name,
+        'posted_date': job.get('posted_date') or 'Unknown',
+        'remote': 'Yes' if job.get('remote') else 'No',
+        'employment_type': job.get('employment_type') or 'Not specified',
+        'salary': job.get('salary') or 'Not specified',
+        'url': job.get('url', '#'),
+        'match_reason': job.get('match_reason', 'General fit'),
+        'excerpt': description[:600] if description else 'No description available',
+        'company_tag': company.replace(' ', '-').replace(',', '').lower(),
+    })
+
+
+def cover_letter_filename(job: dict) -> str:
+    """Filename for a job's cover letter: 'Company - Title.md', truncated."""
+    safe_company = job.get('company', 'Company').translate(_FILENAME_UNSAFE)[:50]
+    safe_title = job.get('title', 'Position').translate(_FILENAME_UNSAFE)[:40]
+    return f"{safe_company} - {safe_title}.md"
+
+
+def unique_filenames(jobs: list[dict]) -> list[str]:
+    """Cover letter filenames for jobs, suffixing ' (2)', ' (3)', ... on clashes.
+
+    Truncation can map different jobs to the same name; each letter in a run
+    must get its own file. Names are compared casefolded, since macOS and
+    Windows filesystems treat 'Acme' and 'ACME' as the same file.
+    """
+    taken = set()
+    names = []
+    for job in jobs:
+        name = cover_letter_filename(job)
+        stem, n = name[:-len('.md')], 2
+        while name.casefold() in taken:
+            name = f"{stem} ({n}).md"
+            n += 1
+        taken.add(name.casefold())
+        names.append(name)
+    return names
+
+
+def write_cover_letter(job: dict, config: dict, output_dir: Path,
+                       today: str | None = None, user_info: dict | None = None,
+                       filename: str | None = None) -> str:
+    """Render one job's cover letter into output_dir. Returns the filename.
+
+    `filename` defaults to cover_letter_filename(job); batch callers pass
+    names from unique_filenames so no two letters share a file.
+    """
+    cover_letter = generate_cover_letter(job, config, today, user_info)
+    filename = filename or cover_letter_filename(job)
+
+    with open(output_dir / filename, 'w') as f:
+        f.write(cover_letter)
+    return filename
 
 
 def main():
@@ -158,8 +240,7 @@ def main():
     output_dir = output_base / today
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    with open(Path(args.jobs).expanduser()) as f:
-        jobs = json.load(f)
+    jobs = load_json(args.jobs)
 
     if args.indices:
         selected_indices = [int(i.strip()) - 1 for i in args.indices.split(',')]
@@ -168,23 +249,21 @@ def main():
         jobs_to_process = jobs[:min(args.top, len(jobs))]
 
     num_letters = len(jobs_to_process)
+    user_info = get_user_info(config)
 
     print(f"Generating {num_letters} cover letters in {output_dir}/")
 
-    for i, job in enumerate(jobs_to_process, 1):
-        title = job.get('title', 'Position')
-        company = job.get('company', 'Company')
-
-        cover_letter = generate_cover_letter(job, config)
+    def write(job, filename):
+        return write_cover_letter(job, config, output_dir, today, user_info, filename)
 
-        safe_company = company.replace('/', '_').replace(':', '_').replace('|', '_')[:50]
-        safe_title = title.replace('/', '_').replace(':', '_').replace('|', '_')[:40]
-        filename = f"{safe_company} - {safe_title}.md"
-
-        output_file = output_dir / filename
-        with open(output_file, 'w') as f:
-            f.write(cover_letter)
+    names = unique_filenames(jobs_to_process)
+    if num_letters < MIN_PARALLEL_LETTERS:
+        filenames = list(map(write, jobs_to_process, names))
+    else:
+        with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as ex:
+            filenames = list(ex.map(write, jobs_to_process, names))
 
+    for i, filename in enumerate(filenames, 1):
         print(f"  {i}. {filename}")
 
     print(f"\nGenerated {num_letters} cover letter(s) in {output_dir}/")
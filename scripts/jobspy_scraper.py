@@ -18,8 +18,8 @@ Usage:
     python jobspy_scraper.py --keywords "data scientist" --location "Boston"
 """
 
-import json
 import math
+import operator
 import sys
 import time
 from datetime import datetime
@@ -28,7 +28,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from common.config import load_config
-from common.dedup import deduplicate_jobs, filter_seen_jobs, generate_job_id
+from common.date_utils import parse_job_date
+from common.dedup import (deduplicate_jobs, filter_seen_jobs, generate_job_id,
+                          load_seen_jobs, prefilter)
+from common.json_utils import dump_json
 
 # Map config job_domains to JobSpy site names
 DOMAIN_TO_SITE = {
@@ -50,6 +53,14 @@ DEFAULT_REQUEST_DELAY = 3
 # Seconds to wait before retrying a failed site once
 RETRY_DELAY = 10
 
+# DataFrame columns normalize_jobspy_row reads. JobSpy returns ~30 columns;
+# projecting first keeps the per-row dicts from to_dict() small.
+JOBSPY_COLUMNS = [
+    "title", "company", "location", "description", "job_url", "job_url_direct",
+    "date_posted", "site", "job_type", "is_remote",
+    "min_amount", "max_amount", "interval", "currency",
+]
+
 TIME_RANGE_TO_HOURS = {
     "day": 24,
     "week": 168,
@@ -129,9 +140,27 @@ def _truthy(val) -> bool:
     return bool(val)
 
 
-def normalize_jobspy_row(row: dict) -> dict:
-    """Normalize a JobSpy DataFrame row (as dict) to the common job dict format."""
-    url = _str(row.get("job_url") or row.get("job_url_direct"))
+def _row_url(row: dict) -> str:
+    return _str(row.get("job_url") or row.get("job_url_direct"))
+
+
+def _seen_stub(row: dict) -> dict:
+    """Dedup-only stand-in for an already-tracked row (see dedup.prefilter)."""
+    return {"title": _str(row.get("title")), "company": _str(row.get("company")),
+            "source": _str(row.get("site"))}
+
+
+def normalize_jobspy_row(row: dict, scraped_at: str | None = None,
+                         id_cache: dict[str, str] | None = None,
+                         now: datetime | None = None) -> dict:
+    """Normalize a JobSpy DataFrame row (as dict) to the common job dict format.
+
+    `scraped_at` is the run's ISO timestamp, shared by every row of a batch;
+    `now` is the matching clock reading that relative dates are anchored at.
+    `id_cache` maps URL -> job id across calls, so a posting returned for
+    several keywords is only hashed once.
+    """
+    url = _row_url(row)
     title = _str(row.get("title"))
     company = _str(row.get("company"))
     location = _str(row.get("location"))
@@ -161,9 +190,19 @@ def normalize_jobspy_row(row: dict) -> dict:
         "experience_level": "",
         "remote": remote,
         "source": site,
-        "scraped_at": datetime.now().isoformat(),
+        "scraped_at": scraped_at or datetime.now().isoformat(),
+        # Internal sort key; popped by scrape_jobs before output
+        "_sort_ts": parse_job_date(posted_date, now) or datetime.min,
     }
-    job["id"] = generate_job_id(job)
+    # Keyed like generate_job_id: a blank URL falls back to title/company/
+    # location, so it must never share a cache entry
+    url_key = url.strip()
+    if url_key and id_cache is not None:
+        if url_key not in id_cache:
+            id_cache[url_key] = generate_job_id(job)
+        job["id"] = id_cache[url_key]
+    else:
+        job["id"] = generate_job_id(job)
     return job
 
 
@@ -197,7 +236,10 @@ def _scrape_site(scrape_jobs_fn, site: str, kw: str, loc: str, *,
     for attempt in (1, 2):
         try:
             df = scrape_jobs_fn(**kwargs)
-            return df.to_dict(orient="records") if df is not None and len(df) > 0 else []
+            if df is None or len(df) == 0:
+                return []
+            df = df[[c for c in JOBSPY_COLUMNS if c in df.columns]]
+            return df.to_dict(orient="records")
         except Exception as e:
             last_err = e
             if attempt == 1:
@@ -238,7 +280,14 @@ def scrape_jobs(
     print(f"Sites: {sites} | Time range: {time_range} ({hours_old}h) | "
           f"Results/keyword: {results_wanted} | LinkedIn descriptions: {fetch_description}")
 
+    skip_seen = skip_seen and bool(config.get("obsidian_vault"))
+    seen_ids = load_seen_jobs(config["obsidian_vault"]) if skip_seen else set()
+
     all_jobs = []
+    now = datetime.now()
+    scraped_at = now.isoformat()
+    seen_urls: set[str] = set()
+    id_cache: dict[str, str] = {}
     site_totals: dict[str, int] = {s: 0 for s in sites}
     first_call = True
     for kw in keywords_list:
@@ -267,9 +316,17 @@ def scrape_jobs(
                     "remote" in str(r.get("location", "")).lower() or
                     "remote" in str(r.get("title", "")).lower()]
 
-        normalized = [normalize_jobspy_row(r) for r in rows]
-        all_jobs.extend(normalized)
-        print(f"  Found {len(normalized)} postings")
+        # Overlapping keywords return many of the same postings; only
+        # normalize rows neither an earlier keyword nor a tracker produced
+        batch, tracked = prefilter(
+            rows, _row_url, _seen_stub,
+            lambda r: normalize_jobspy_row(r, scraped_at, id_cache, now),
+            seen_urls, seen_ids, id_cache)
+        all_jobs.extend(batch)
+        found = len(batch) - tracked
+        repeats = len(rows) - found
+        print(f"  Found {found} postings"
+              + (f" ({repeats} repeats/previously seen skipped)" if repeats else ""))
 
     print("Per-site totals: " + ", ".join(f"{s}={n}" for s, n in site_totals.items()))
     if all(n == 0 for n in site_totals.values()) and keywords_list:
@@ -280,12 +337,14 @@ def scrape_jobs(
     # Deduplicate across keywords
     all_jobs = deduplicate_jobs(all_jobs)
 
-    # Filter previously seen jobs
-    if skip_seen and config.get("obsidian_vault"):
-        all_jobs = filter_seen_jobs(all_jobs, config["obsidian_vault"])
+    # Filter previously seen jobs (the stubs above, plus URL-less postings)
+    if skip_seen:
+        all_jobs = filter_seen_jobs(all_jobs, config["obsidian_vault"], seen_ids)
 
-    # Sort by posted date (newest first)
-    all_jobs.sort(key=lambda j: j.get("posted_date", ""), reverse=True)
+    # Sort by posted date (newest first); unparseable dates sink to the end
+    all_jobs.sort(key=operator.itemgetter("_sort_ts"), reverse=True)
+    for job in all_jobs:
+        del job["_sort_ts"]
 
     print(f"Total: {len(all_jobs)} new jobs after dedup")
     return all_jobs
@@ -310,13 +369,11 @@ def main():
         skip_seen=not args.include_seen,
     )
 
-    output = json.dumps(jobs, indent=2, default=str)
     if args.output:
-        with open(args.output, "w") as f:
-            f.write(output)
+        dump_json(jobs, args.output)
         print(f"Saved {len(jobs)} jobs to {args.output}")
     else:
-        print(output)
+        dump_json(jobs)
 
 
 if __name__ == "__main__":
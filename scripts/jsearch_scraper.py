@@ -19,21 +19,48 @@ Usage:
     python jsearch_scraper.py --keywords "data scientist" --location "Boston"
 """
 
-import json
+import asyncio
+import hashlib
+import importlib.util
+import operator
+import os
+import random
 import sys
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import httpx
+if TYPE_CHECKING:
+    import httpx  # imported lazily in _search_all; keeps module import cheap
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from common.config import load_config
-from common.dedup import deduplicate_jobs, filter_seen_jobs, generate_job_id
+from common.dedup import (deduplicate_jobs, filter_seen_jobs, generate_job_id,
+                          load_seen_jobs, prefilter)
+from common.json_utils import dump_json, dumps, load_json, loads
 
 JSEARCH_URL = "https://jsearch.p.rapidapi.com/search"
 JSEARCH_HOST = "jsearch.p.rapidapi.com"
 
+# Keyword queries allowed in flight at once, and request starts per second;
+# override with search.max_concurrency / search.rps in config
+MAX_CONCURRENT_QUERIES = 5
+DEFAULT_RPS = 5
+
+# Rate-limit and transient server errors are retried with exponential backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0  # seconds; doubles per attempt
+RETRY_MAX_DELAY = 30.0
+
+# Raw JSearch responses are cached on disk: results change slowly and the
+# free plan allows only 200 requests/month
+CACHE_DIR = Path.home() / ".cache" / "job-hunter" / "jsearch"
+CACHE_TTL = 3600  # seconds
+
 # Map config time_range to JSearch date_posted parameter
 TIME_RANGE_TO_DATE_POSTED = {
     "day": "today",
@@ -76,14 +103,29 @@ def _location(job: dict) -> str:
     return loc
 
 
-def normalize_jsearch_result(job: dict) -> dict:
-    """Normalize a JSearch API result to the common job dict format."""
+def _raw_url(job: dict) -> str:
+    return job.get("job_apply_link") or job.get("job_google_link") or ""
+
+
+def _seen_stub(job: dict) -> dict:
+    """Dedup-only stand-in for an already-tracked result (see dedup.prefilter)."""
+    return {"title": job.get("job_title") or "", "company": job.get("employer_name") or "",
+            "source": (job.get("job_publisher") or "jsearch").lower()}
+
+
+def normalize_jsearch_result(job: dict, scraped_at: str | None = None) -> dict:
+    """Normalize a JSearch API result to the common job dict format.
+
+    `scraped_at` is the run's ISO timestamp, shared by every result of a batch.
+    """
     title = job.get("job_title") or ""
     company = job.get("employer_name") or ""
     description = job.get("job_description") or ""
-    url = job.get("job_apply_link") or job.get("job_google_link") or ""
+    url = _raw_url(job)
     posted_date = job.get("job_posted_at_datetime_utc") or ""
-    remote = bool(job.get("job_is_remote")) or "remote" in (title + " " + description).lower()
+    # Checked field by field: no concatenated copy of a multi-KB description
+    remote = (bool(job.get("job_is_remote")) or "remote" in title.lower()
+              or "remote" in description.lower())
     employment_type = (job.get("job_employment_type") or "").lower().replace("_", " ")
 
     # Publisher tells us where it came from (e.g. "LinkedIn", "Indeed")
@@ -101,57 +143,193 @@ def normalize_jsearch_result(job: dict) -> dict:
         "experience_level": "",
         "remote": remote,
         "source": source,
-        "scraped_at": datetime.now().isoformat(),
+        "scraped_at": scraped_at or datetime.now().isoformat(),
     }
     result["id"] = generate_job_id(result)
     return result
 
 
-def search_jobs(
-    api_key: str,
+class RateLimiter:
+    """Spaces request starts at least 1/rps seconds apart."""
+
+    def __init__(self, rps: float):
+        self._interval = 1 / rps if rps > 0 else 0.0
+        self._next_ts = 0.0
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        wait = self._next_ts - now
+        self._next_ts = max(now, self._next_ts) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _retry_delay(attempt: int, resp: "httpx.Response | None" = None) -> float:
+    """Backoff before retry number `attempt` + 1, honoring a numeric Retry-After."""
+    delay = RETRY_BASE_DELAY * 2 ** attempt
+    if resp is not None:
+        try:
+            delay = float(resp.headers.get("Retry-After", delay))
+        except ValueError:
+            pass
+    return min(delay, RETRY_MAX_DELAY) + random.uniform(0, 0.25)
+
+
+def _cache_path(query: str, date_posted: str, remote_only: bool, num_results: int) -> Path:
+    key = hashlib.sha1(f"{query}|{date_posted}|{remote_only}|{num_results}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _cache_get(path: Path) -> list[dict] | None:
+    """Return cached raw results if present and younger than CACHE_TTL."""
+    try:
+        entry = load_json(path)
+    except (OSError, ValueError):
+        return None
+    if time.time() - entry.get("ts", 0) >= CACHE_TTL:
+        path.unlink(missing_ok=True)
+        return None
+    return entry.get("data")
+
+
+def _cache_put(path: Path, data: list[dict]) -> None:
+    """Store raw results; written to a temp file and renamed into place, so
+    a concurrent reader or an interrupted run never sees a partial entry."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps({"ts": time.time(), "data": data}))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        print(f"  JSearch cache write failed: {e}", file=sys.stderr)
+
+
+def _cache_sweep() -> None:
+    """Delete cache entries (and stray temp files) older than CACHE_TTL."""
+    cutoff = time.time() - CACHE_TTL
+    try:
+        entries = list(CACHE_DIR.iterdir())
+    except OSError:
+        return  # no cache yet
+    for path in entries:
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+async def search_jobs(
+    client: "httpx.AsyncClient",
+    headers: dict,
+    base_params: dict,
     query: str,
     num_results: int = 10,
-    date_posted: str = "week",
-    remote_only: bool = False,
+    use_cache: bool = True,
+    limiter: RateLimiter | None = None,
 ) -> list[dict]:
-    """Call JSearch API for a single query; returns raw job dicts."""
-    headers = {
-        "X-RapidAPI-Key": api_key,
-        "X-RapidAPI-Host": JSEARCH_HOST,
-    }
-    params = {
-        "query": query,
-        "page": "1",
-        "num_pages": "1",
-        "date_posted": date_posted,
-    }
-    if remote_only:
-        params["remote_jobs_only"] = "true"
-
-    # JSearch returns 10 results per page; request extra pages if more needed
-    all_data: list[dict] = []
-    pages_needed = max(1, (num_results + 9) // 10)
-
-    with httpx.Client(timeout=30) as client:
-        for page in range(1, pages_needed + 1):
-            params["page"] = str(page)
-            try:
-                resp = client.get(JSEARCH_URL, headers=headers, params=params)
-                if resp.status_code != 200:
-                    print(
-                        f"  JSearch API error {resp.status_code}: {resp.text[:200]}",
-                        file=sys.stderr,
-                    )
-                    break
-                data = resp.json().get("data") or []
-                all_data.extend(data)
-                if len(data) < 10:
-                    break  # no more results
-            except Exception as e:
-                print(f"  JSearch request error: {e}", file=sys.stderr)
-                break
-
-    return all_data[:num_results]
+    """Call JSearch API for a single query; returns raw job dicts.
+
+    `headers` and `base_params` (date_posted, remote_jobs_only) are built
+    once per run by scrape_jobs and shared by every query; num_pages is sized
+    from `num_results` so one round-trip fetches them all.
+    Responses are served from the on-disk cache when fresh (see CACHE_TTL);
+    pass use_cache=False to always hit the API. Cache misses wait on
+    `limiter`, if given, before calling out. 429/5xx responses and transport
+    errors are retried up to MAX_ATTEMPTS times with exponential backoff.
+    """
+    import httpx
+
+    cache_path = _cache_path(query, base_params["date_posted"],
+                             "remote_jobs_only" in base_params, num_results)
+    if use_cache:
+        cached = _cache_get(cache_path)
+        if cached is not None:
+            print(f"  (cached) {query}")
+            return cached
+
+    # JSearch returns 10 results per page
+    params = {**base_params, "query": query,
+              "num_pages": str(max(1, (num_results + 9) // 10))}
+    for attempt in range(MAX_ATTEMPTS):
+        last_try = attempt == MAX_ATTEMPTS - 1
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            resp = await client.get(JSEARCH_URL, headers=headers, params=params)
+        except httpx.TransportError as e:
+            print(f"  JSearch request error: {e}", file=sys.stderr)
+            if last_try:
+                return []
+            await asyncio.sleep(_retry_delay(attempt))
+            continue
+        except Exception as e:
+            print(f"  JSearch request error: {e}", file=sys.stderr)
+            return []
+
+        if resp.status_code == 200:
+            break
+        print(
+            f"  JSearch API error {resp.status_code}: {resp.text[:200]}",
+            file=sys.stderr,
+        )
+        if resp.status_code not in RETRY_STATUSES or last_try:
+            return []
+        await asyncio.sleep(_retry_delay(attempt, resp))
+
+    try:
+        all_data = loads(resp.content).get("data") or []
+    except Exception as e:
+        print(f"  JSearch response error: {e}", file=sys.stderr)
+        return []
+
+    if len(all_data) > num_results:
+        all_data = all_data[:num_results]
+    _cache_put(cache_path, all_data)
+    return all_data
+
+
+async def _search_all(
+    headers: dict,
+    base_params: dict,
+    queries: list[tuple[str, int]],
+    use_cache: bool,
+    max_concurrency: int = MAX_CONCURRENT_QUERIES,
+    rps: float = DEFAULT_RPS,
+) -> list[list[dict]]:
+    """Run every (query, num_results) pair concurrently on one shared client;
+    results in query order.
+
+    At most `max_concurrency` requests are in flight and new ones start no
+    faster than `rps` per second, to stay under RapidAPI's rate limits.
+    """
+    import httpx
+
+    _cache_sweep()
+
+    # HTTP/2 multiplexes every query over one TLS connection; it needs the
+    # optional h2 package (pip install "httpx[http2]")
+    http2 = importlib.util.find_spec("h2") is not None
+
+    sem = asyncio.Semaphore(max_concurrency)
+    limiter = RateLimiter(rps)
+    limits = httpx.Limits(max_connections=max_concurrency,
+                          max_keepalive_connections=max_concurrency)
+
+    async with httpx.AsyncClient(timeout=30, http2=http2, limits=limits) as client:
+        async def bounded(query: str, num_results: int) -> list[dict]:
+            async with sem:
+                return await search_jobs(client, headers, base_params, query,
+                                         num_results, use_cache=use_cache,
+                                         limiter=limiter)
+
+        return await asyncio.gather(*(bounded(q, n) for q, n in queries))
 
 
 def scrape_jobs(
@@ -159,6 +337,7 @@ def scrape_jobs(
     keywords: list[str] | None = None,
     location: str | None = None,
     skip_seen: bool = True,
+    use_cache: bool = True,
 ) -> list[dict]:
     """Search jobs using JSearch for each keyword, aggregate and deduplicate."""
     api_key = config.get("jsearch_api_key", "")
@@ -175,29 +354,70 @@ def scrape_jobs(
     date_posted = TIME_RANGE_TO_DATE_POSTED.get(time_range, "week")
     num_results = search_config.get("max_results_per_query", 10)
     remote = bool(search_config.get("remote"))
-
-    print(f"Date posted filter: {date_posted} | Results/keyword: {num_results}")
-
-    all_jobs = []
-    for kw in keywords_list:
+    max_concurrency = max(1, int(search_config.get("max_concurrency", MAX_CONCURRENT_QUERIES)))
+    rps = float(search_config.get("rps", DEFAULT_RPS))
+    # Keywords OR-ed into each request; >1 trades per-keyword recall for
+    # fewer calls against the monthly quota
+    batch_size = max(1, int(search_config.get("query_batch_size", 1)))
+
+    print(f"Date posted filter: {date_posted} | Results/keyword: {num_results}"
+          + (f" | Keywords/query: {batch_size}" if batch_size > 1 else ""))
+
+    # (query, results wanted) pairs; a batched query asks for the results of
+    # every keyword in its group
+    queries = []
+    for i in range(0, len(keywords_list), batch_size):
+        group = keywords_list[i:i + batch_size]
+        # Quote multi-keyword groups so "a b OR c d" isn't read as "a (b OR c) d"
+        kw = " OR ".join(f'"{k}"' for k in group) if len(group) > 1 else group[0]
         query = f"{kw} {loc}".strip() if loc else kw
         if remote and "remote" not in query.lower():
             query = f"{query} remote"
-        print(f"Searching: {query}")
-        raw = search_jobs(api_key, query, num_results, date_posted, remote_only=remote)
-        normalized = [normalize_jsearch_result(r) for r in raw]
-        all_jobs.extend(normalized)
-        print(f"  Found {len(normalized)} postings")
+        queries.append((query, num_results * len(group)))
 
-    # Deduplicate across keywords
+    headers = {
+        "X-RapidAPI-Key": api_key,
+        "X-RapidAPI-Host": JSEARCH_HOST,
+    }
+    base_params = {"date_posted": date_posted}
+    if remote:
+        base_params["remote_jobs_only"] = "true"
+
+    raw_lists = asyncio.run(
+        _search_all(headers, base_params, queries, use_cache, max_concurrency, rps))
+
+    skip_seen = skip_seen and bool(config.get("obsidian_vault"))
+    seen_ids = load_seen_jobs(config["obsidian_vault"]) if skip_seen else set()
+
+    all_jobs = []
+    scraped_at = datetime.now().isoformat()
+    seen_urls: set[str] = set()
+    for (query, _), raw in zip(queries, raw_lists):
+        print(f"Searching: {query}")
+        # Skip postings an earlier keyword already returned, or an earlier
+        # tracker already listed, before paying for normalization
+        batch, tracked = prefilter(
+            raw, _raw_url, _seen_stub,
+            lambda r: normalize_jsearch_result(r, scraped_at),
+            seen_urls, seen_ids)
+        all_jobs.extend(batch)
+        found = len(batch) - tracked
+        repeats = len(raw) - found
+        print(f"  Found {found} postings"
+              + (f" ({repeats} repeats/previously seen skipped)" if repeats else ""))
+
+    # Deduplicate across keywords by (title, company); URL repeats are
+    # already gone
     all_jobs = deduplicate_jobs(all_jobs)
 
-    # Filter previously seen jobs
-    if skip_seen and config.get("obsidian_vault"):
-        all_jobs = filter_seen_jobs(all_jobs, config["obsidian_vault"])
+    # Filter previously seen jobs (the stubs above, plus URL-less postings)
+    if skip_seen:
+        all_jobs = filter_seen_jobs(all_jobs, config["obsidian_vault"], seen_ids)
 
-    # Sort by posted date (newest first)
-    all_jobs.sort(key=lambda j: j.get("posted_date", ""), reverse=True)
+    # Sort by posted date (newest first). JSearch dates are uniform ISO-8601
+    # UTC strings, so they order correctly as text.
+    if len(all_jobs) > 1:
+        all_jobs.sort(key=operator.itemgetter("posted_date"), reverse=True)
 
     print(f"Total: {len(all_jobs)} new jobs after dedup")
     return all_jobs
@@ -211,6 +431,8 @@ def main():
     parser.add_argument("--location")
     parser.add_argument("--output", "-o")
     parser.add_argument("--include-seen", action="store_true")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk JSearch response cache")
 
     args = parser.parse_args()
     config = load_config(args.config)
@@ -220,15 +442,14 @@ def main():
         keywords=args.keywords,
         location=args.location,
         skip_seen=not args.include_seen,
+        use_cache=not args.no_cache,
     )
 
-    output = json.dumps(jobs, indent=2, default=str)
     if args.output:
-        with open(args.output, "w") as f:
-            f.write(output)
+        dump_json(jobs, args.output)
         print(f"Saved {len(jobs)} jobs to {args.output}")
     else:
-        print(output)
+        dump_json(jobs)
 
 
 if __name__ == "__main__":
@@ -30,7 +30,6 @@ row numbers still align with cover-letter --indices.
 """
 
 import argparse
-import json
 import os
 import sys
 from pathlib import Path
@@ -39,6 +38,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from common.config import load_config
 from common.job_scoring import load_resume_text
+from common.json_utils import dump_json, load_json
 
 DEFAULT_TOP = 30
 RESUME_CHARS = 4000
@@ -46,8 +46,7 @@ DESCRIPTION_CHARS = 1200
 
 
 def cmd_prep(args) -> None:
-    with open(Path(args.input).expanduser()) as f:
-        jobs = json.load(f)
+    jobs = load_json(args.input)
 
     resume_text = ""
     if args.resume:
@@ -108,10 +107,8 @@ def cmd_prep(args) -> None:
 
 
 def cmd_apply(args) -> None:
-    with open(Path(args.input).expanduser()) as f:
-        jobs = json.load(f)
-    with open(Path(args.scores).expanduser()) as f:
-        scores = json.load(f)
+    jobs = load_json(args.input)
+    scores = load_json(args.scores)
 
     applied = 0
     for job in jobs:
@@ -128,7 +125,7 @@ def cmd_apply(args) -> None:
     jobs.sort(key=lambda j: j.get("final_score", 0), reverse=True)
 
     output_path = Path(args.output or args.input).expanduser()
-    output_path.write_text(json.dumps(jobs, indent=2, default=str))
+    dump_json(jobs, output_path)
     print(f"Applied AI scores to {applied}/{len(jobs)} jobs; re-sorted by final_score → {output_path}")
 
 
@@ -16,13 +16,13 @@ Provider can also be set in config.json:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from common.config import load_config
+from common.json_utils import dump_json
 
 
 def main():
@@ -36,6 +36,8 @@ def main():
     parser.add_argument("--output", "-o", help="Output JSON file (default: stdout)")
     parser.add_argument("--include-seen", action="store_true",
                         help="Include previously seen jobs")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the JSearch response cache (jsearch provider only)")
 
     args = parser.parse_args()
     config = load_config(args.config)
@@ -52,20 +54,17 @@ def main():
 
     if provider == "jsearch":
         from jsearch_scraper import scrape_jobs as jsearch_scrape
-        jobs = jsearch_scrape(**common_kwargs)
+        jobs = jsearch_scrape(**common_kwargs, use_cache=not args.no_cache)
     else:
         from jobspy_scraper import scrape_jobs as jobspy_scrape
         jobs = jobspy_scrape(**common_kwargs)
 
-    output = json.dumps(jobs, indent=2, default=str)
-
     if args.output:
         Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-        with open(args.output, "w") as f:
-            f.write(output)
+        dump_json(jobs, args.output)
         print(f"Saved {len(jobs)} jobs to {args.output}")
     else:
-        print(output)
+        dump_json(jobs)
 
 
 if __name__ == "__main__":
@@ -8,13 +8,13 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from common.job_scoring import score_jobs
+from common.json_utils import dump_json, load_json
 
 
 def main():
@@ -30,25 +30,20 @@ def main():
     if not resume_path and args.config:
         config_path = Path(args.config).expanduser()
         if config_path.exists():
-            with open(config_path) as f:
-                cfg = json.load(f)
+            cfg = load_json(config_path)
             resume_path = cfg.get("resume_path")
 
-    with open(Path(args.input).expanduser()) as f:
-        jobs = json.load(f)
+    jobs = load_json(args.input)
 
     scored = score_jobs(jobs, resume_path=resume_path)
     print(f"Scored {len(scored)} jobs", file=sys.stderr)
 
-    output = json.dumps(scored, indent=2, default=str)
-
     if args.output:
         Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-        with open(args.output, "w") as f:
-            f.write(output)
+        dump_json(scored, args.output)
         print(f"Saved to {args.output}", file=sys.stderr)
     else:
-        print(output)
+        dump_json(scored)
 
 
 if __name__ == "__main__":
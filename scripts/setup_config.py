@@ -82,6 +82,15 @@ def prompt_list(message: str, default: list | None = None) -> list:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
+def _exists(path: str) -> bool:
+    """True if `path` (with ~ expanded) exists; a single stat call."""
+    try:
+        os.stat(os.path.expanduser(path))
+    except OSError:
+        return False
+    return True
+
+
 def validate_config(config: dict) -> list[str]:
     """Validate configuration and return list of errors."""
     errors = []
@@ -93,12 +102,12 @@ def validate_config(config: dict) -> list[str]:
 
     if not config.get("resume_path"):
         errors.append("Missing resume path")
-    elif not Path(config["resume_path"]).expanduser().exists():
+    elif not _exists(config["resume_path"]):
         errors.append(f"Resume file not found: {config['resume_path']}")
 
     if not config.get("obsidian_vault"):
         errors.append("Missing Obsidian vault path")
-    elif not Path(config["obsidian_vault"]).expanduser().exists():
+    elif not _exists(config["obsidian_vault"]):
         errors.append(f"Obsidian vault not found: {config['obsidian_vault']}")
 
     search = config.get("search", {})
@@ -12,7 +12,6 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from datetime import date
 from pathlib import Path
@@ -20,6 +19,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from common.config import load_config
+from common.json_utils import load_json
 
 DEFAULT_MIN_SCORE = 70
 
@@ -102,8 +102,7 @@ def main():
         print(f"Tracker already exists for today, skipping: {tracker_path}")
         return
 
-    with open(Path(args.input).expanduser()) as f:
-        jobs = json.load(f)
+    jobs = load_json(args.input)
 
     content, count = build_tracker(jobs, min_score, today)
     tracker_path.write_text(content)